@@ -1,5 +1,11 @@
 """OpenTelemetry to MongoDB API service."""
 
+import os
+
+
+# Prefer the upb protobuf runtime; this must be set before any protobuf module is imported
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 __version__ = "0.1.0"
 __description__ = """FastAPI service for collecting
 OpenTelemetry data and storing in MongoDB"""
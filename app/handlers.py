@@ -1,89 +1,130 @@
 """Exception handlers for the FastAPI application."""
 
+import os
+from functools import lru_cache
+
 import structlog
-from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Response
 from google.protobuf.message import DecodeError
 from pydantic import ValidationError
 
 from .models import ErrorResponse, Status
+from .responses import ORJSONResponse
 
 
 logger = structlog.get_logger()
 
+# Client errors are expected under flaky exporters; only capture tracebacks on request
+_DEBUG_TRACEBACKS = os.getenv("OTEL_DEBUG_TRACEBACKS") == "1"
+
+_BAD_REQUEST_TYPE = "type.googleapis.com/google.rpc.BadRequest"
+
+_SUPPORTED_TYPES = "application/json, application/x-protobuf"
+_ACCEPT_HEADERS = {"Accept": _SUPPORTED_TYPES}
+
+# Protobuf error payload is static apart from the message, so build it once
+_INVALID_PROTOBUF_STATUS = Status(
+    code=3,  # INVALID_ARGUMENT in OTLP status codes
+    message="",
+    details=[{"@type": _BAD_REQUEST_TYPE, "field_violations": []}],
+).model_dump()
+
+
+# The 500 body never varies, so serialize it once
+_INTERNAL_ERROR_BODY = ErrorResponse(
+    success=False, message="Internal server error", error_code="INTERNAL_ERROR"
+).model_dump_json()
+
 
 class ProtobufParsingError(Exception):
     """Exception raised when protobuf parsing fails."""
 
 
+@lru_cache(maxsize=64)
+def _unsupported_content_type_detail(content_type: str) -> str:
+    """Format the 415 detail message, cached per attempted content type."""
+    return f"Unsupported content type: {content_type}. Supported types: {_SUPPORTED_TYPES}"
+
+
 def unsupported_content_type_error(content_type: str) -> HTTPException:
     """Create HTTP 415 error for unsupported content types."""
+    # A fresh exception per raise, since a shared one would accumulate tracebacks
     return HTTPException(
         status_code=415,
-        detail=f"Unsupported content type: {content_type}. Supported types: application/json, application/x-protobuf",
-        headers={"Accept": "application/json, application/x-protobuf"},
+        detail=_unsupported_content_type_detail(content_type),
+        headers=_ACCEPT_HEADERS,
+    )
+
+
+def request_too_large_error(max_bytes: int) -> HTTPException:
+    """Create HTTP 413 error for request bodies over the size limit."""
+    return HTTPException(
+        status_code=413,
+        detail=f"Request body too large. Maximum size: {max_bytes} bytes",
     )
 
 
 async def protobuf_parsing_exception_handler(request: Request, exc: ProtobufParsingError):
     """Handle protobuf parsing errors with OTLP-compliant error response."""
-    logger.error("Protobuf parsing error", error=str(exc), exc_info=True)
-    return JSONResponse(
+    logger.warning(
+        "Protobuf parsing error",
+        error=str(exc),
+        error_type=type(exc).__name__,
+        exc_info=_DEBUG_TRACEBACKS,
+    )
+    return ORJSONResponse(
         status_code=400,
-        content=Status(
-            code=3,  # INVALID_ARGUMENT in OTLP status codes
-            message=f"Invalid protobuf data: {exc!s}",
-            details=[
-                {"@type": "type.googleapis.com/google.rpc.BadRequest", "field_violations": []}
-            ],
-        ).model_dump(),
+        content={**_INVALID_PROTOBUF_STATUS, "message": f"Invalid protobuf data: {exc!s}"},
     )
 
 
 async def decode_error_exception_handler(request: Request, exc: DecodeError):
     """Handle protobuf decode errors with OTLP-compliant error response."""
-    logger.error("Protobuf decode error", error=str(exc), exc_info=True)
-    return JSONResponse(
+    logger.warning(
+        "Protobuf decode error",
+        error=str(exc),
+        error_type=type(exc).__name__,
+        exc_info=_DEBUG_TRACEBACKS,
+    )
+    return ORJSONResponse(
         status_code=400,
-        content=Status(
-            code=3,  # INVALID_ARGUMENT in OTLP status codes
-            message=f"Invalid protobuf data: {exc!s}",
-            details=[
-                {"@type": "type.googleapis.com/google.rpc.BadRequest", "field_violations": []}
-            ],
-        ).model_dump(),
+        content={**_INVALID_PROTOBUF_STATUS, "message": f"Invalid protobuf data: {exc!s}"},
     )
 
 
 async def validation_exception_handler(request: Request, exc: ValidationError):
     """Handle Pydantic validation errors with OTLP-compliant error response."""
-    logger.error("Validation error", error=str(exc), exc_info=True)
+    logger.warning(
+        "Validation error",
+        error=str(exc),
+        error_type=type(exc).__name__,
+        exc_info=_DEBUG_TRACEBACKS,
+    )
     # Extract field errors for OTLP-compliant response
-    field_violations = []
-    for error in exc.errors():
-        field_violations.append(
-            {"field": ".".join(str(loc) for loc in error["loc"]), "description": error["msg"]}
-        )
+    field_violations = [
+        {"field": ".".join(map(str, error["loc"])), "description": error["msg"]}
+        for error in exc.errors(include_url=False, include_context=False, include_input=False)
+    ]
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
-        content=Status(
-            code=3,  # INVALID_ARGUMENT in OTLP status codes
-            message="Validation error in telemetry data",
-            details=[
-                {
-                    "@type": "type.googleapis.com/google.rpc.BadRequest",
-                    "field_violations": field_violations,
-                }
-            ],
-        ).model_dump(),
+        content={
+            "code": 3,  # INVALID_ARGUMENT in OTLP status codes
+            "message": "Validation error in telemetry data",
+            "details": [{"@type": _BAD_REQUEST_TYPE, "field_violations": field_violations}],
+        },
     )
 
 
 async def json_parsing_exception_handler(request: Request, exc: ValueError):
     """Handle JSON parsing errors (ValueError, UnicodeDecodeError)."""
-    logger.error("JSON parsing error", error=str(exc), exc_info=True)
-    return JSONResponse(
+    logger.warning(
+        "JSON parsing error",
+        error=str(exc),
+        error_type=type(exc).__name__,
+        exc_info=_DEBUG_TRACEBACKS,
+    )
+    return ORJSONResponse(
         status_code=422,
         content={"detail": f"Invalid JSON: {exc!s}"},
     )
@@ -91,8 +132,13 @@ async def json_parsing_exception_handler(request: Request, exc: ValueError):
 
 async def unicode_decode_exception_handler(request: Request, exc: UnicodeDecodeError):
     """Handle Unicode decode errors in JSON parsing."""
-    logger.error("Unicode decode error", error=str(exc), exc_info=True)
-    return JSONResponse(
+    logger.warning(
+        "Unicode decode error",
+        error=str(exc),
+        error_type=type(exc).__name__,
+        exc_info=_DEBUG_TRACEBACKS,
+    )
+    return ORJSONResponse(
         status_code=422,
         content={"detail": f"Invalid JSON: {exc!s}"},
     )
@@ -101,19 +147,15 @@ async def unicode_decode_exception_handler(request: Request, exc: UnicodeDecodeE
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all unhandled exceptions."""
     logger.error("Unhandled exception", error=str(exc), exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content=ErrorResponse(
-            success=False, message="Internal server error", error_code="INTERNAL_ERROR"
-        ).model_dump(),
-    )
+    return Response(status_code=500, content=_INTERNAL_ERROR_BODY, media_type="application/json")
 
 
-def register_exception_handlers(app):
+def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers with the FastAPI app."""
-    app.exception_handler(ProtobufParsingError)(protobuf_parsing_exception_handler)
-    app.exception_handler(DecodeError)(decode_error_exception_handler)
-    app.exception_handler(ValidationError)(validation_exception_handler)
-    app.exception_handler(ValueError)(json_parsing_exception_handler)
-    app.exception_handler(UnicodeDecodeError)(unicode_decode_exception_handler)
-    app.exception_handler(Exception)(global_exception_handler)
+    # Starlette types every handler as taking Exception; each one only receives its own type
+    app.add_exception_handler(ProtobufParsingError, protobuf_parsing_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(DecodeError, decode_error_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(ValidationError, validation_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(ValueError, json_parsing_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(UnicodeDecodeError, unicode_decode_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(Exception, global_exception_handler)
@@ -9,53 +9,217 @@ This is an OTLP (OpenTelemetry Protocol) receiver that:
 - Handles content-type based routing (application/json, application/x-protobuf)
 """
 
+import asyncio
 import logging
 import os
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
+from typing import Annotated, cast
 
+import orjson
 import structlog
-from fastapi import FastAPI, Request
-from google.protobuf.json_format import MessageToDict
+from fastapi import Depends, FastAPI, Request, Response
+from google.protobuf.internal import api_implementation
 from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
 from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from pydantic import ValidationError
 
 from .handlers import (
     ProtobufParsingError,
     register_exception_handlers,
+    request_too_large_error,
     unsupported_content_type_error,
 )
 from .models import OTELLogsData, OTELMetricsData, OTELTracesData
 from .mongo_client import MongoDBClient
 from .otel_service import OTELService
+from .responses import ORJSONResponse
 
 
 # Configure logging
+_LOG_LEVEL = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper())
 structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
     ],
-    wrapper_class=structlog.make_filtering_bound_logger(
-        getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper())
-    ),
-    logger_factory=structlog.PrintLoggerFactory(),
+    wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVEL),
+    # orjson renders bytes, which BytesLogger writes without re-encoding
+    logger_factory=structlog.BytesLoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
-logger = structlog.get_logger()
+# Bind once after configure so log calls skip the lazy proxy
+logger = structlog.get_logger().bind(service="otel-to-mongodb-api")
+
+# Debug log arguments scan the whole body, so skip building them when filtered out
+_DEBUG_ENABLED = _LOG_LEVEL <= logging.DEBUG
+
+# Supported request media types
+_CONTENT_TYPE_JSON = "application/json"
+_CONTENT_TYPE_PROTOBUF = "application/x-protobuf"
+_CANONICAL_CONTENT_TYPES = {
+    _CONTENT_TYPE_JSON.encode(): _CONTENT_TYPE_JSON,
+    _CONTENT_TYPE_PROTOBUF.encode(): _CONTENT_TYPE_PROTOBUF,
+}
+
+# Telemetry model and protobuf decoder for each signal
+_MODELS: dict[str, type[OTELTracesData] | type[OTELMetricsData] | type[OTELLogsData]] = {
+    "traces": OTELTracesData,
+    "metrics": OTELMetricsData,
+    "logs": OTELLogsData,
+}
+_PROTOBUF_PARSERS = {
+    "traces": ExportTraceServiceRequest.FromString,
+    "metrics": ExportMetricsServiceRequest.FromString,
+    "logs": ExportLogsServiceRequest.FromString,
+}
+
+# OTLP success responses are an empty Export*ServiceResponse in the request's encoding,
+# so skip serializing it per request
+_SUCCESS_BODIES = {_CONTENT_TYPE_JSON: b"{}", _CONTENT_TYPE_PROTOBUF: b""}
+
+# Bodies above this size are rejected with 413 before being fully buffered
+_MAX_REQUEST_BODY_BYTES = int(os.getenv("MAX_REQUEST_BODY_BYTES", str(16 * 1024 * 1024)))
+
+# Bodies above this size are decoded in a worker thread
+_OFFLOAD_THRESHOLD_BYTES = 256 * 1024
+
+
+def _get_content_type(request: Request) -> str:
+    """Return the normalized request media type, defaulting to JSON."""
+    # Scan the raw ASGI header list to avoid building a Headers mapping
+    headers: list[tuple[bytes, bytes]] = request.scope["headers"]
+    for name, value in headers:
+        if name == b"content-type":
+            # Canonical values (the common case) need no splitting or lowercasing
+            canonical = _CANONICAL_CONTENT_TYPES.get(value)
+            if canonical is not None:
+                return canonical
+            return value.partition(b";")[0].strip().lower().decode("latin-1")
+    return _CONTENT_TYPE_JSON
+
+
+def _debug_bytes_summary(raw_data: bytearray) -> dict:
+    """Summarize a request body for debug logging."""
+    return {
+        "data_size": len(raw_data),
+        "data_hex_start": raw_data[:50].hex(),
+        "data_hex_end": raw_data[-50:].hex() if len(raw_data) > 50 else "",
+        # A UTF-8 replacement character means a client mangled binary data as text
+        "utf8_corrupted": raw_data.find(b"\xef\xbf\xbd") != -1,
+    }
+
+
+async def _read_body(request: Request) -> bytearray:
+    """Read the request body, enforcing the configured size limit."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > _MAX_REQUEST_BODY_BYTES:
+            raise request_too_large_error(_MAX_REQUEST_BODY_BYTES)
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > _MAX_REQUEST_BODY_BYTES:
+            raise request_too_large_error(_MAX_REQUEST_BODY_BYTES)
+    # Parsers all accept the buffer directly, so skip copying it into bytes
+    return body
+
+
+async def _parse_request_data(
+    request: Request, content_type: str, data_type: str
+) -> OTELTracesData | OTELMetricsData | OTELLogsData:
+    """Read the request body once and parse it according to its content type."""
+    parse = _CONTENT_TYPE_PARSERS.get(content_type)
+    if parse is None:
+        raise unsupported_content_type_error(content_type)
+
+    raw_data = await _read_body(request)
+    if _DEBUG_ENABLED:
+        logger.debug(
+            "Received request",
+            data_type=data_type,
+            content_type=content_type,
+            **_debug_bytes_summary(raw_data),
+            user_agent=request.headers.get("user-agent", ""),
+        )
+
+    # Reject empty bodies before dispatch, keeping each media type's usual error response
+    if not raw_data:
+        if content_type == _CONTENT_TYPE_PROTOBUF:
+            raise ProtobufParsingError("Empty protobuf data")
+        raise ValueError("Empty request body")
+
+    # Large bodies would stall other requests while decoding on the event loop
+    if len(raw_data) > _OFFLOAD_THRESHOLD_BYTES:
+        return await asyncio.to_thread(parse, raw_data, data_type)
+    return parse(raw_data, data_type)
+
+
+def _parse_json_data(
+    raw_data: bytearray, data_type: str
+) -> OTELTracesData | OTELMetricsData | OTELLogsData:
+    """Parse a JSON OTLP request body into the model for data_type."""
+    # Decode and validate in one pass inside pydantic-core
+    try:
+        return _MODELS[data_type].model_validate_json(raw_data)
+    except ValidationError as exc:
+        errors = exc.errors(include_url=False)
+        # Malformed JSON keeps the plain JSON parsing error response
+        if errors[0]["type"] == "json_invalid":
+            raise ValueError(errors[0]["ctx"]["error"]) from None
+        raise
+
+
+def _parse_protobuf_data(
+    raw_data: bytearray, data_type: str
+) -> OTELTracesData | OTELMetricsData | OTELLogsData:
+    """Parse a protobuf OTLP request body into the model for data_type."""
+    try:
+        # FromString accepts any buffer, so the body is decoded without a bytes copy
+        pb_request = _PROTOBUF_PARSERS[data_type](cast(bytes, raw_data))
+        if _DEBUG_ENABLED:
+            logger.debug(
+                "Parsed protobuf request",
+                data_type=data_type,
+                pb_fields=list(pb_request.DESCRIPTOR.fields_by_name.keys()),
+            )
+    except Exception as e:
+        # The decode error handler logs the rejection; only add the body summary when debugging
+        if _DEBUG_ENABLED:
+            logger.debug(
+                "Failed to parse protobuf request",
+                data_type=data_type,
+                error=str(e),
+                **_debug_bytes_summary(raw_data),
+            )
+        raise
+
+    # _PROTOBUF_PARSERS decodes the request type matching each model
+    return _MODELS[data_type].from_protobuf(pb_request)  # type: ignore[arg-type]
+
+
+_CONTENT_TYPE_PARSERS = {
+    _CONTENT_TYPE_JSON: _parse_json_data,
+    _CONTENT_TYPE_PROTOBUF: _parse_protobuf_data,
+}
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    logger.info("Starting OTEL to MongoDB API")
+    logger.info("Starting OTEL to MongoDB API", protobuf_backend=api_implementation.Type())
+    if api_implementation.Type() == "python":
+        logger.warning("Pure-Python protobuf backend loaded, protobuf ingest will be slow")
 
     # Initialize MongoDB connections
     mongodb_client = MongoDBClient()
     await mongodb_client.connect()
     app.state.mongodb_client = mongodb_client
+    app.state.otel_service = OTELService(mongodb_client)
 
     yield
 
@@ -64,7 +228,34 @@ async def lifespan(app: FastAPI):
     await mongodb_client.disconnect()
 
 
-def create_app() -> FastAPI:  # noqa: PLR0915
+def get_otel_service(request: Request) -> OTELService:
+    """Return the OTELService created at startup."""
+    service: OTELService = request.app.state.otel_service
+    return service
+
+
+def _make_submit(data_type: str) -> Callable[..., Awaitable[Response]]:
+    """Create the submit endpoint for one telemetry signal."""
+    process_name = f"process_{data_type}"
+
+    async def submit(
+        request: Request,
+        service: Annotated[OTELService, Depends(get_otel_service)],
+    ) -> Response:
+        content_type = _get_content_type(request)
+        data = await _parse_request_data(request, content_type, data_type)
+
+        await getattr(service, process_name)(data)
+
+        # Return OTLP-compliant response (success case)
+        return Response(_SUCCESS_BODIES[content_type], media_type=content_type)
+
+    submit.__name__ = f"submit_{data_type}"
+    submit.__doc__ = f"Submit OpenTelemetry {data_type} (JSON or protobuf format)."
+    return submit
+
+
+def create_app() -> FastAPI:
     """
     Create FastAPI application.
 
@@ -75,6 +266,7 @@ def create_app() -> FastAPI:  # noqa: PLR0915
         description="JSON-based OTLP receiver for OpenTelemetry data",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Register exception handlers
@@ -103,204 +295,8 @@ def create_app() -> FastAPI:  # noqa: PLR0915
         }
 
     # Telemetry endpoints
-    @app.post("/v1/traces")
-    async def submit_traces(
-        request: Request,
-    ):
-        """Submit OpenTelemetry traces (JSON or protobuf format)."""
-        # Get and normalize content type, default to json
-        content_type = request.headers.get("content-type", "application/json")
-        content_type = content_type.split(";")[0].strip().lower()
-
-        # Parse based on content type
-        if "application/json" in content_type:
-            json_data = await request.json()
-            traces_data = OTELTracesData(**json_data)
-        elif "application/x-protobuf" in content_type:
-            raw_data = await request.body()
-            logger.debug(
-                "Received protobuf traces request",
-                data_size=len(raw_data) if raw_data else 0,
-                content_type=content_type,
-                data_hex_start=raw_data[:50].hex() if raw_data else "",
-                data_hex_end=raw_data[-50:].hex() if len(raw_data) > 50 else "",
-                utf8_corrupted=b"\xef\xbf\xbd" in raw_data if raw_data else False,
-                user_agent=request.headers.get("user-agent", ""),
-            )
-
-            if not raw_data:
-                raise ProtobufParsingError("Empty protobuf data")
-
-            # Parse protobuf directly using Google's MessageToDict
-            pb_request = ExportTraceServiceRequest()
-            try:
-                pb_request.ParseFromString(raw_data)
-                logger.debug(
-                    "Parsed protobuf request",
-                    pb_fields=list(pb_request.DESCRIPTOR.fields_by_name.keys()),
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to parse protobuf traces",
-                    error=str(e),
-                    data_size=len(raw_data),
-                    utf8_corrupted=b"\xef\xbf\xbd" in raw_data,
-                    data_hex_start=raw_data[:50].hex() if len(raw_data) > 0 else "",
-                    data_hex_end=raw_data[-50:].hex() if len(raw_data) > 50 else "",
-                )
-                raise
-
-            traces_dict = MessageToDict(
-                pb_request,
-                preserving_proto_field_name=False,  # Use camelCase for Pydantic aliases
-                use_integers_for_enums=True,
-            )
-            logger.debug(
-                "Converted to dict", dict_keys=list(traces_dict.keys()) if traces_dict else []
-            )
-            traces_data = OTELTracesData(**traces_dict)
-        else:
-            raise unsupported_content_type_error(content_type)
-
-        mongodb_client = request.app.state.mongodb_client
-        service = OTELService(mongodb_client)
-        await service.process_traces(traces_data)
-
-        # Return OTLP-compliant response (success case)
-        return {}
-
-    @app.post("/v1/metrics")
-    async def submit_metrics(
-        request: Request,
-    ):
-        """Submit OpenTelemetry metrics (JSON or protobuf format)."""
-        # Get and normalize content type
-        content_type = request.headers.get("content-type", "application/json")
-        content_type = content_type.split(";")[0].strip().lower()
-
-        # Parse based on content type
-        if "application/json" in content_type:
-            json_data = await request.json()
-            metrics_data = OTELMetricsData(**json_data)
-        elif "application/x-protobuf" in content_type:
-            raw_data = await request.body()
-            logger.debug(
-                "Received protobuf metrics request",
-                data_size=len(raw_data) if raw_data else 0,
-                content_type=content_type,
-                data_hex_start=raw_data[:50].hex() if raw_data else "",
-                data_hex_end=raw_data[-50:].hex() if len(raw_data) > 50 else "",
-                utf8_corrupted=b"\xef\xbf\xbd" in raw_data if raw_data else False,
-                user_agent=request.headers.get("user-agent", ""),
-            )
-
-            if not raw_data:
-                raise ProtobufParsingError("Empty protobuf data")
-
-            # Parse protobuf directly using Google's MessageToDict
-            pb_request = ExportMetricsServiceRequest()
-            try:
-                pb_request.ParseFromString(raw_data)
-                logger.debug(
-                    "Parsed protobuf metrics request",
-                    pb_fields=list(pb_request.DESCRIPTOR.fields_by_name.keys()),
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to parse protobuf metrics",
-                    error=str(e),
-                    data_size=len(raw_data),
-                    utf8_corrupted=b"\xef\xbf\xbd" in raw_data,
-                    data_hex_start=raw_data[:50].hex() if len(raw_data) > 0 else "",
-                    data_hex_end=raw_data[-50:].hex() if len(raw_data) > 50 else "",
-                )
-                raise
-
-            metrics_dict = MessageToDict(
-                pb_request,
-                preserving_proto_field_name=False,  # Use camelCase for Pydantic aliases
-                use_integers_for_enums=True,
-            )
-            logger.debug(
-                "Converted metrics to dict",
-                dict_keys=list(metrics_dict.keys()) if metrics_dict else [],
-            )
-            metrics_data = OTELMetricsData(**metrics_dict)
-        else:
-            raise unsupported_content_type_error(content_type)
-
-        mongodb_client = request.app.state.mongodb_client
-        service = OTELService(mongodb_client)
-        await service.process_metrics(metrics_data)
-
-        # Return OTLP-compliant response (success case)
-        return {}
-
-    @app.post("/v1/logs")
-    async def submit_logs(
-        request: Request,
-    ):
-        """Submit OpenTelemetry logs (JSON or protobuf format)."""
-        # Get and normalize content type
-        content_type = request.headers.get("content-type", "application/json")
-        content_type = content_type.split(";")[0].strip().lower()
-
-        # Parse based on content type
-        if "application/json" in content_type:
-            json_data = await request.json()
-            logs_data = OTELLogsData(**json_data)
-        elif "application/x-protobuf" in content_type:
-            raw_data = await request.body()
-            logger.debug(
-                "Received protobuf logs request",
-                data_size=len(raw_data) if raw_data else 0,
-                content_type=content_type,
-                data_hex_start=raw_data[:50].hex() if raw_data else "",
-                data_hex_end=raw_data[-50:].hex() if len(raw_data) > 50 else "",
-                utf8_corrupted=b"\xef\xbf\xbd" in raw_data if raw_data else False,
-                user_agent=request.headers.get("user-agent", ""),
-            )
-
-            if not raw_data:
-                raise ProtobufParsingError("Empty protobuf data")
-
-            # Parse protobuf directly using Google's MessageToDict
-            pb_request = ExportLogsServiceRequest()
-            try:
-                pb_request.ParseFromString(raw_data)
-                logger.debug(
-                    "Parsed protobuf logs request",
-                    pb_fields=list(pb_request.DESCRIPTOR.fields_by_name.keys()),
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to parse protobuf logs",
-                    error=str(e),
-                    data_size=len(raw_data),
-                    utf8_corrupted=b"\xef\xbf\xbd" in raw_data,
-                    data_hex_start=raw_data[:50].hex() if len(raw_data) > 0 else "",
-                    data_hex_end=raw_data[-50:].hex() if len(raw_data) > 50 else "",
-                )
-                raise
-
-            logs_dict = MessageToDict(
-                pb_request,
-                preserving_proto_field_name=False,  # Use camelCase for Pydantic aliases
-                use_integers_for_enums=True,
-            )
-            logger.debug(
-                "Converted logs to dict", dict_keys=list(logs_dict.keys()) if logs_dict else []
-            )
-            logs_data = OTELLogsData(**logs_dict)
-        else:
-            raise unsupported_content_type_error(content_type)
-
-        mongodb_client = request.app.state.mongodb_client
-        service = OTELService(mongodb_client)
-        await service.process_logs(logs_data)
-
-        # Return OTLP-compliant response (success case)
-        return {}
+    for data_type in _MODELS:
+        app.post(f"/v1/{data_type}")(_make_submit(data_type))
 
     return app
 
@@ -311,4 +307,17 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
+    if os.getenv("ENV") == "prod":
+        # uvloop and httptools ship with uvicorn[standard]
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+            loop="uvloop",
+            http="httptools",
+            log_level="warning",
+            access_log=False,
+        )
+    else:
+        uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
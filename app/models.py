@@ -1,61 +1,73 @@
 """Pydantic models for OpenTelemetry data and API responses."""
 
-from typing import Any
+from typing import Any, Self, TypedDict
 
-from pydantic import BaseModel, Field, field_validator
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.alias_generators import to_camel
+
+from .otlp_to_dict import logs_request_to_dict, metric_request_to_dict, trace_request_to_dict
 
 
 # OpenTelemetry Base Models
-class OTELAttribute(BaseModel):
-    """OpenTelemetry attribute."""
+class _OTELBase(BaseModel):
+    """Shared configuration for OpenTelemetry models; aliases are the OTLP camelCase names."""
+
+    model_config = ConfigDict(extra="ignore", alias_generator=to_camel, populate_by_name=True)
+
+
+class OTELAttribute(TypedDict):
+    """OpenTelemetry attribute, validated as a plain dict rather than a model instance."""
 
     key: str
     value: dict[str, Any]
 
 
-class OTELResource(BaseModel):
+class OTELResource(_OTELBase):
     """OpenTelemetry resource."""
 
     attributes: list[OTELAttribute] = Field(default_factory=list)
 
 
-class OTELScope(BaseModel):
+class OTELScope(_OTELBase):
     """OpenTelemetry instrumentation scope."""
 
     name: str
     version: str | None = None
 
 
-class OTELSpan(BaseModel):
+class OTELSpan(_OTELBase):
     """OpenTelemetry span."""
 
-    trace_id: str = Field(alias="traceId")
-    span_id: str = Field(alias="spanId")
+    trace_id: str
+    span_id: str
     name: str
     kind: int
-    start_time_unix_nano: str = Field(alias="startTimeUnixNano")
-    end_time_unix_nano: str = Field(alias="endTimeUnixNano")
+    start_time_unix_nano: str
+    end_time_unix_nano: str
     attributes: list[OTELAttribute] = Field(default_factory=list)
 
 
-class OTELScopeSpans(BaseModel):
+class OTELScopeSpans(_OTELBase):
     """OpenTelemetry scope spans."""
 
     scope: OTELScope
     spans: list[OTELSpan] = Field(default_factory=list)
 
 
-class OTELResourceSpans(BaseModel):
+class OTELResourceSpans(_OTELBase):
     """OpenTelemetry resource spans."""
 
     resource: OTELResource
-    scope_spans: list[OTELScopeSpans] = Field(default_factory=list, alias="scopeSpans")
+    scope_spans: list[OTELScopeSpans] = Field(default_factory=list)
 
 
-class OTELTracesData(BaseModel):
+class OTELTracesData(_OTELBase):
     """OpenTelemetry traces data."""
 
-    resource_spans: list[OTELResourceSpans] = Field(alias="resourceSpans")
+    resource_spans: list[OTELResourceSpans]
 
     @field_validator("resource_spans")
     @classmethod
@@ -65,32 +77,38 @@ class OTELTracesData(BaseModel):
             raise ValueError("resourceSpans cannot be empty")
         return v
 
+    @classmethod
+    def from_protobuf(cls, pb: ExportTraceServiceRequest) -> Self:
+        """Build from a parsed protobuf request without going through MessageToDict."""
+        data = trace_request_to_dict(pb)
+        return cls.model_validate(data)
+
 
 # Metrics Models
-class OTELNumberDataPoint(BaseModel):
+class OTELNumberDataPoint(_OTELBase):
     """OpenTelemetry number data point."""
 
-    time_unix_nano: str = Field(alias="timeUnixNano")
-    as_double: float | None = Field(default=None, alias="asDouble")
-    as_int: str | None = Field(default=None, alias="asInt")
+    time_unix_nano: str
+    as_double: float | None = None
+    as_int: str | None = None
     attributes: list[OTELAttribute] = Field(default_factory=list)
 
 
-class OTELSum(BaseModel):
+class OTELSum(_OTELBase):
     """OpenTelemetry sum metric."""
 
-    data_points: list[OTELNumberDataPoint] = Field(alias="dataPoints")
-    aggregation_temporality: int = Field(alias="aggregationTemporality")
-    is_monotonic: bool = Field(alias="isMonotonic")
+    data_points: list[OTELNumberDataPoint]
+    aggregation_temporality: int
+    is_monotonic: bool
 
 
-class OTELGauge(BaseModel):
+class OTELGauge(_OTELBase):
     """OpenTelemetry gauge metric."""
 
-    data_points: list[OTELNumberDataPoint] = Field(alias="dataPoints")
+    data_points: list[OTELNumberDataPoint]
 
 
-class OTELMetric(BaseModel):
+class OTELMetric(_OTELBase):
     """OpenTelemetry metric."""
 
     name: str
@@ -108,24 +126,24 @@ class OTELMetric(BaseModel):
         return v.strip()
 
 
-class OTELScopeMetrics(BaseModel):
+class OTELScopeMetrics(_OTELBase):
     """OpenTelemetry scope metrics."""
 
     scope: OTELScope
     metrics: list[OTELMetric] = Field(default_factory=list)
 
 
-class OTELResourceMetrics(BaseModel):
+class OTELResourceMetrics(_OTELBase):
     """OpenTelemetry resource metrics."""
 
     resource: OTELResource
-    scope_metrics: list[OTELScopeMetrics] = Field(default_factory=list, alias="scopeMetrics")
+    scope_metrics: list[OTELScopeMetrics] = Field(default_factory=list)
 
 
-class OTELMetricsData(BaseModel):
+class OTELMetricsData(_OTELBase):
     """OpenTelemetry metrics data."""
 
-    resource_metrics: list[OTELResourceMetrics] = Field(alias="resourceMetrics")
+    resource_metrics: list[OTELResourceMetrics]
 
     @field_validator("resource_metrics")
     @classmethod
@@ -135,38 +153,44 @@ class OTELMetricsData(BaseModel):
             raise ValueError("resourceMetrics cannot be empty")
         return v
 
+    @classmethod
+    def from_protobuf(cls, pb: ExportMetricsServiceRequest) -> Self:
+        """Build from a parsed protobuf request without going through MessageToDict."""
+        data = metric_request_to_dict(pb)
+        return cls.model_validate(data)
+
 
 # Logs Models
-class OTELLogRecord(BaseModel):
+class OTELLogRecord(_OTELBase):
     """OpenTelemetry log record."""
 
-    time_unix_nano: str | None = Field(default=None, alias="timeUnixNano")
-    severity_number: int | None = Field(default=None, alias="severityNumber")
-    severity_text: str | None = Field(default=None, alias="severityText")
-    body: dict[str, Any] | None = None
+    time_unix_nano: str | None = None
+    severity_number: int | None = None
+    severity_text: str | None = None
+    body: Any = None  # AnyValue stored as received, so skip validating its contents
     attributes: list[OTELAttribute] = Field(default_factory=list)
-    trace_id: str | None = Field(default=None, alias="traceId")
-    span_id: str | None = Field(default=None, alias="spanId")
+    trace_id: str | None = None
+    span_id: str | None = None
 
 
-class OTELScopeLogs(BaseModel):
+class OTELScopeLogs(_OTELBase):
     """OpenTelemetry scope logs."""
 
     scope: OTELScope
-    log_records: list[OTELLogRecord] = Field(default_factory=list, alias="logRecords")
+    log_records: list[OTELLogRecord] = Field(default_factory=list)
 
 
-class OTELResourceLogs(BaseModel):
+class OTELResourceLogs(_OTELBase):
     """OpenTelemetry resource logs."""
 
     resource: OTELResource
-    scope_logs: list[OTELScopeLogs] = Field(default_factory=list, alias="scopeLogs")
+    scope_logs: list[OTELScopeLogs] = Field(default_factory=list)
 
 
-class OTELLogsData(BaseModel):
+class OTELLogsData(_OTELBase):
     """OpenTelemetry logs data."""
 
-    resource_logs: list[OTELResourceLogs] = Field(alias="resourceLogs")
+    resource_logs: list[OTELResourceLogs]
 
     @field_validator("resource_logs")
     @classmethod
@@ -176,6 +200,12 @@ class OTELLogsData(BaseModel):
             raise ValueError("resourceLogs cannot be empty")
         return v
 
+    @classmethod
+    def from_protobuf(cls, pb: ExportLogsServiceRequest) -> Self:
+        """Build from a parsed protobuf request without going through MessageToDict."""
+        data = logs_request_to_dict(pb)
+        return cls.model_validate(data)
+
 
 # OTLP Response Documentation
 # According to the OTLP specification, successful responses return an empty JSON object {}
@@ -1,8 +1,7 @@
 """OpenTelemetry data processing service."""
 
-from typing import Any
-
 import structlog
+from pydantic import BaseModel
 
 from .models import OTELLogsData, OTELMetricsData, OTELTracesData
 from .mongo_client import MongoDBClient
@@ -10,6 +9,13 @@ from .mongo_client import MongoDBClient
 
 logger = structlog.get_logger()
 
+# Model attributes leading from each payload type down to its individual records
+_COUNT_ATTRS = {
+    "traces": ("resource_spans", "scope_spans", "spans"),
+    "metrics": ("resource_metrics", "scope_metrics", "metrics"),
+    "logs": ("resource_logs", "scope_logs", "log_records"),
+}
+
 
 class OTELService:
     """Service for processing OpenTelemetry data."""
@@ -19,70 +25,27 @@ class OTELService:
 
     async def process_traces(self, traces_data: OTELTracesData, request_id: str = None) -> None:
         """Process OpenTelemetry traces data."""
-        # Convert to dict and count records
-        data_dict = traces_data.model_dump(by_alias=True)
-        count_keys = ("resourceSpans", "scopeSpans", "spans")
-        record_count = self._count_records(data_dict, count_keys)
-
-        logger.info("Processing traces", request_id=request_id, record_count=record_count)
-
-        # Store in database
-        result = await self.mongodb_client.write_telemetry_data(
-            data=data_dict, data_type="traces", request_id=request_id
-        )
-
-        # Check write result and raise exception on failure
-        if not result.get("success", False):
-            errors = result.get("errors", [])
-            if not errors:
-                errors = [result.get("error", "Unknown error")]
-            error_msg = f"Failed to write traces data: {errors}"
-            logger.error("Database write failed", request_id=request_id, result=result)
-            raise RuntimeError(error_msg)
-
-        logger.info(
-            "Successfully processed traces", request_id=request_id, record_count=record_count
-        )
+        await self._process(traces_data, "traces", request_id)
 
     async def process_metrics(self, metrics_data: OTELMetricsData, request_id: str = None) -> None:
         """Process OpenTelemetry metrics data."""
-        # Convert to dict and count records
-        data_dict = metrics_data.model_dump(by_alias=True)
-        count_keys = ("resourceMetrics", "scopeMetrics", "metrics")
-        record_count = self._count_records(data_dict, count_keys)
-
-        logger.info("Processing metrics", request_id=request_id, record_count=record_count)
-
-        # Store in database
-        result = await self.mongodb_client.write_telemetry_data(
-            data=data_dict, data_type="metrics", request_id=request_id
-        )
-
-        # Check write result and raise exception on failure
-        if not result.get("success", False):
-            errors = result.get("errors", [])
-            if not errors:
-                errors = [result.get("error", "Unknown error")]
-            error_msg = f"Failed to write metrics data: {errors}"
-            logger.error("Database write failed", request_id=request_id, result=result)
-            raise RuntimeError(error_msg)
-
-        logger.info(
-            "Successfully processed metrics", request_id=request_id, record_count=record_count
-        )
+        await self._process(metrics_data, "metrics", request_id)
 
     async def process_logs(self, logs_data: OTELLogsData, request_id: str = None) -> None:
         """Process OpenTelemetry logs data."""
-        # Convert to dict and count records
-        data_dict = logs_data.model_dump(by_alias=True)
-        count_keys = ("resourceLogs", "scopeLogs", "logRecords")
-        record_count = self._count_records(data_dict, count_keys)
+        await self._process(logs_data, "logs", request_id)
+
+    async def _process(self, data: BaseModel, data_type: str, request_id: str | None) -> None:
+        """Count, store and log a telemetry payload of the given data type."""
+        # Count records on the model, then convert to dict for storage
+        record_count = self._count_records(data, _COUNT_ATTRS[data_type])
+        data_dict = data.model_dump(by_alias=True, exclude_none=True)
 
-        logger.info("Processing logs", request_id=request_id, record_count=record_count)
+        logger.info(f"Processing {data_type}", request_id=request_id, record_count=record_count)
 
         # Store in database
         result = await self.mongodb_client.write_telemetry_data(
-            data=data_dict, data_type="logs", request_id=request_id
+            data=data_dict, data_type=data_type, request_id=request_id
         )
 
         # Check write result and raise exception on failure
@@ -90,17 +53,19 @@ class OTELService:
             errors = result.get("errors", [])
             if not errors:
                 errors = [result.get("error", "Unknown error")]
-            error_msg = f"Failed to write logs data: {errors}"
+            error_msg = f"Failed to write {data_type} data: {errors}"
             logger.error("Database write failed", request_id=request_id, result=result)
             raise RuntimeError(error_msg)
 
-        logger.info("Successfully processed logs", request_id=request_id, record_count=record_count)
+        logger.info(
+            f"Successfully processed {data_type}", request_id=request_id, record_count=record_count
+        )
 
-    def _count_records(self, data: dict[str, Any], count_keys: tuple[str, str, str]) -> int:
-        """Count records in telemetry data using the provided key hierarchy."""
-        resource_key, scope_key, record_key = count_keys
+    def _count_records(self, data: BaseModel, count_attrs: tuple[str, str, str]) -> int:
+        """Count records in a telemetry model using the provided attribute hierarchy."""
+        resource_attr, scope_attr, record_attr = count_attrs
         count = 0
-        for resource_item in data.get(resource_key, []):
-            for scope_item in resource_item.get(scope_key, []):
-                count += len(scope_item.get(record_key, []))
+        for resource_item in getattr(data, resource_attr):
+            for scope_item in getattr(resource_item, scope_attr):
+                count += len(getattr(scope_item, record_attr))
         return count
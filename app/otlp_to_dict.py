@@ -0,0 +1,206 @@
+"""
+Convert parsed OTLP protobuf requests to the dicts the telemetry models validate.
+
+These mirror MessageToDict(preserving_proto_field_name=False, use_integers_for_enums=True)
+for the fields the models read, walking the known schema with direct attribute access
+instead of descriptor reflection. Trace and span IDs are rendered as hex as in OTLP/JSON.
+"""
+
+import base64
+from collections.abc import Iterable
+from typing import Any
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord, ResourceLogs, ScopeLogs
+from opentelemetry.proto.metrics.v1.metrics_pb2 import (
+    Metric,
+    NumberDataPoint,
+    ResourceMetrics,
+    ScopeMetrics,
+)
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span
+
+
+_SCALAR_ANY_VALUE_KEYS = {
+    "string_value": "stringValue",
+    "double_value": "doubleValue",
+    "bool_value": "boolValue",
+}
+
+
+def _any_value_to_dict(value: AnyValue) -> dict[str, Any]:
+    """Convert an AnyValue message to its OTLP/JSON dict form."""
+    kind = value.WhichOneof("value")
+    if kind in _SCALAR_ANY_VALUE_KEYS:
+        return {_SCALAR_ANY_VALUE_KEYS[kind]: getattr(value, kind)}
+    if kind == "int_value":
+        return {"intValue": str(value.int_value)}
+    if kind == "array_value":
+        values = value.array_value.values
+        return {"arrayValue": {"values": [_any_value_to_dict(v) for v in values]} if values else {}}
+    if kind == "kvlist_value":
+        entries = value.kvlist_value.values
+        return {"kvlistValue": {"values": _attributes_to_list(entries)} if entries else {}}
+    if kind == "bytes_value":
+        return {"bytesValue": base64.b64encode(value.bytes_value).decode()}
+    return {}
+
+
+def _attributes_to_list(attributes: Iterable[KeyValue]) -> list[dict[str, Any]]:
+    """Convert repeated KeyValue messages to attribute dicts."""
+    result: list[dict[str, Any]] = []
+    for kv in attributes:
+        attribute: dict[str, Any] = {}
+        if kv.key:
+            attribute["key"] = kv.key
+        if kv.HasField("value"):
+            attribute["value"] = _any_value_to_dict(kv.value)
+        result.append(attribute)
+    return result
+
+
+def _resource_to_dict(message: ResourceSpans | ResourceMetrics | ResourceLogs) -> dict[str, Any]:
+    """Convert the resource of a Resource* message, omitting it when unset."""
+    if not message.HasField("resource"):
+        return {}
+    return {"resource": {"attributes": _attributes_to_list(message.resource.attributes)}}
+
+
+def _scope_to_dict(message: ScopeSpans | ScopeMetrics | ScopeLogs) -> dict[str, Any]:
+    """Convert the scope of a Scope* message, omitting it when unset."""
+    if not message.HasField("scope"):
+        return {}
+    scope: dict[str, Any] = {}
+    if message.scope.name:
+        scope["name"] = message.scope.name
+    if message.scope.version:
+        scope["version"] = message.scope.version
+    return {"scope": scope}
+
+
+def _span_to_dict(span: Span) -> dict[str, Any]:
+    """Convert a Span message."""
+    data: dict[str, Any] = {"attributes": _attributes_to_list(span.attributes)}
+    if span.trace_id:
+        data["traceId"] = span.trace_id.hex()
+    if span.span_id:
+        data["spanId"] = span.span_id.hex()
+    if span.name:
+        data["name"] = span.name
+    if span.kind:
+        data["kind"] = span.kind
+    if span.start_time_unix_nano:
+        data["startTimeUnixNano"] = str(span.start_time_unix_nano)
+    if span.end_time_unix_nano:
+        data["endTimeUnixNano"] = str(span.end_time_unix_nano)
+    return data
+
+
+def trace_request_to_dict(pb: ExportTraceServiceRequest) -> dict[str, Any]:
+    """Convert an ExportTraceServiceRequest to the OTELTracesData dict shape."""
+    return {
+        "resourceSpans": [
+            {
+                **_resource_to_dict(rs),
+                "scopeSpans": [
+                    {**_scope_to_dict(ss), "spans": [_span_to_dict(span) for span in ss.spans]}
+                    for ss in rs.scope_spans
+                ],
+            }
+            for rs in pb.resource_spans
+        ]
+    }
+
+
+def _number_data_point_to_dict(point: NumberDataPoint) -> dict[str, Any]:
+    """Convert a NumberDataPoint message."""
+    data: dict[str, Any] = {"attributes": _attributes_to_list(point.attributes)}
+    if point.time_unix_nano:
+        data["timeUnixNano"] = str(point.time_unix_nano)
+    kind = point.WhichOneof("value")
+    if kind == "as_double":
+        data["asDouble"] = point.as_double
+    elif kind == "as_int":
+        data["asInt"] = str(point.as_int)
+    return data
+
+
+def _metric_to_dict(metric: Metric) -> dict[str, Any]:
+    """Convert a Metric message, keeping only the gauge and sum data kinds."""
+    data: dict[str, Any] = {}
+    if metric.name:
+        data["name"] = metric.name
+    if metric.description:
+        data["description"] = metric.description
+    if metric.unit:
+        data["unit"] = metric.unit
+    kind = metric.WhichOneof("data")
+    if kind == "gauge":
+        data["gauge"] = {
+            "dataPoints": [_number_data_point_to_dict(p) for p in metric.gauge.data_points]
+        }
+    elif kind == "sum":
+        data["sum"] = {
+            "dataPoints": [_number_data_point_to_dict(p) for p in metric.sum.data_points]
+        }
+        if metric.sum.aggregation_temporality:
+            data["sum"]["aggregationTemporality"] = metric.sum.aggregation_temporality
+        if metric.sum.is_monotonic:
+            data["sum"]["isMonotonic"] = True
+    return data
+
+
+def metric_request_to_dict(pb: ExportMetricsServiceRequest) -> dict[str, Any]:
+    """Convert an ExportMetricsServiceRequest to the OTELMetricsData dict shape."""
+    return {
+        "resourceMetrics": [
+            {
+                **_resource_to_dict(rm),
+                "scopeMetrics": [
+                    {**_scope_to_dict(sm), "metrics": [_metric_to_dict(m) for m in sm.metrics]}
+                    for sm in rm.scope_metrics
+                ],
+            }
+            for rm in pb.resource_metrics
+        ]
+    }
+
+
+def _log_record_to_dict(record: LogRecord) -> dict[str, Any]:
+    """Convert a LogRecord message."""
+    data: dict[str, Any] = {"attributes": _attributes_to_list(record.attributes)}
+    if record.time_unix_nano:
+        data["timeUnixNano"] = str(record.time_unix_nano)
+    if record.severity_number:
+        data["severityNumber"] = record.severity_number
+    if record.severity_text:
+        data["severityText"] = record.severity_text
+    if record.HasField("body"):
+        data["body"] = _any_value_to_dict(record.body)
+    if record.trace_id:
+        data["traceId"] = record.trace_id.hex()
+    if record.span_id:
+        data["spanId"] = record.span_id.hex()
+    return data
+
+
+def logs_request_to_dict(pb: ExportLogsServiceRequest) -> dict[str, Any]:
+    """Convert an ExportLogsServiceRequest to the OTELLogsData dict shape."""
+    return {
+        "resourceLogs": [
+            {
+                **_resource_to_dict(rl),
+                "scopeLogs": [
+                    {
+                        **_scope_to_dict(sl),
+                        "logRecords": [_log_record_to_dict(r) for r in sl.log_records],
+                    }
+                    for sl in rl.scope_logs
+                ],
+            }
+            for rl in pb.resource_logs
+        ]
+    }
@@ -75,6 +75,7 @@ def test_app(mock_mongodb_client):
 
     app = create_app()
     app.state.mongodb_client = mock_mongodb_client
+    app.state.otel_service = OTELService(mock_mongodb_client)
     return app
 
 
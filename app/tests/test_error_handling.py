@@ -29,6 +29,7 @@ class TestProtobufErrorHandling:
         # Details field should be present
         if "details" in data:
             assert isinstance(data["details"], list)
+        assert response.headers["content-type"] == "application/json"
 
     @pytest.mark.unit
     def test_json_parsing_error_response_format(self, client):
@@ -222,16 +223,15 @@ class TestEdgeCaseErrorHandlers:
     @pytest.mark.unit
     def test_unicode_decode_error_handler(self, test_app):
         """Test unicode decode error handling by directly triggering UnicodeDecodeError."""
-        from unittest.mock import patch
+        from unittest.mock import MagicMock, patch
 
         client = TestClient(test_app)
 
-        # Mock request.json() to raise UnicodeDecodeError
-        with patch("starlette.requests.Request.json") as mock_json:
-            mock_json.side_effect = UnicodeDecodeError(
-                "utf-8", b"\xff\xfe", 0, 1, "invalid start byte"
-            )
-
+        # Mock the JSON parser to raise UnicodeDecodeError
+        mock_parse = MagicMock(
+            side_effect=UnicodeDecodeError("utf-8", b"\xff\xfe", 0, 1, "invalid start byte")
+        )
+        with patch.dict("app.main._CONTENT_TYPE_PARSERS", {"application/json": mock_parse}):
             response = client.post(
                 "/v1/traces",
                 json={"dummy": "data"},  # This will be ignored due to mock
@@ -252,11 +252,12 @@ class TestEdgeCaseErrorHandlers:
         # Use TestClient with raise_server_exceptions=False to capture 500 responses
         client = TestClient(test_app, raise_server_exceptions=False)
 
-        # Mock the OTELService to raise an unexpected exception during processing
-        with patch("app.main.OTELService") as mock_otel_service_class:
-            mock_service = mock_otel_service_class.return_value
-            mock_service.process_traces.side_effect = RuntimeError("Unexpected processing error")
-
+        # Make the OTELService raise an unexpected exception during processing
+        with patch.object(
+            test_app.state.otel_service,
+            "process_traces",
+            side_effect=RuntimeError("Unexpected processing error"),
+        ):
             response = client.post(
                 "/v1/traces",
                 json={
@@ -7,6 +7,9 @@ formats automatically through parametrized fixtures.
 """
 
 import pytest
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
 
 from app.models import OTELLogsData, OTELMetricsData, OTELTracesData
 
@@ -24,44 +27,21 @@ TELEMETRY_MODELS = {
     "logs": OTELLogsData,
 }
 
+# Protobuf request mapping for telemetry types
+TELEMETRY_REQUESTS = {
+    "traces": ExportTraceServiceRequest,
+    "metrics": ExportMetricsServiceRequest,
+    "logs": ExportLogsServiceRequest,
+}
 
-async def parse_protobuf_data_via_handler(binary_data, data_type):
-    """Helper to parse protobuf data directly using MessageToDict."""
-    from google.protobuf.json_format import MessageToDict
-    from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
-    from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
-        ExportMetricsServiceRequest,
-    )
-    from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
-
-    from app.models import OTELLogsData, OTELMetricsData, OTELTracesData
 
+async def parse_protobuf_data_via_handler(binary_data, data_type):
+    """Helper to parse protobuf data the way the protobuf request handler does."""
     if not binary_data:
         raise ValueError("Empty protobuf data")
 
-    if data_type == "traces":
-        pb_request = ExportTraceServiceRequest()
-        pb_request.ParseFromString(binary_data)
-        traces_dict = MessageToDict(
-            pb_request, preserving_proto_field_name=False, use_integers_for_enums=True
-        )
-        return OTELTracesData(**traces_dict)
-    elif data_type == "metrics":
-        pb_request = ExportMetricsServiceRequest()
-        pb_request.ParseFromString(binary_data)
-        metrics_dict = MessageToDict(
-            pb_request, preserving_proto_field_name=False, use_integers_for_enums=True
-        )
-        return OTELMetricsData(**metrics_dict)
-    elif data_type == "logs":
-        pb_request = ExportLogsServiceRequest()
-        pb_request.ParseFromString(binary_data)
-        logs_dict = MessageToDict(
-            pb_request, preserving_proto_field_name=False, use_integers_for_enums=True
-        )
-        return OTELLogsData(**logs_dict)
-    else:
-        raise ValueError(f"Unknown data type: {data_type}")
+    pb_request = TELEMETRY_REQUESTS[data_type].FromString(binary_data)
+    return TELEMETRY_MODELS[data_type].from_protobuf(pb_request)
 
 
 async def process_telemetry_data(context, telemetry_data, data_type, request_id):
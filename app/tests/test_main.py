@@ -1,5 +1,6 @@
 """Tests for main FastAPI application."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -33,6 +34,7 @@ class TestLifespanManager:
 
                 # Verify the client was attached to app state
                 assert mock_app.state.mongodb_client == mock_client
+                assert mock_app.state.otel_service.mongodb_client == mock_client
 
             # After shutdown (exiting the context manager)
             # Verify MongoDB client was disconnected
@@ -250,6 +252,17 @@ class TestTelemetryEndpoints:
         # FastAPI returns 422 for invalid JSON/data
         assert response.status_code == 422
 
+    @pytest.mark.unit
+    def test_empty_json_body(self, client, mock_mongodb_client):
+        """Test that an empty JSON body is rejected as invalid JSON."""
+        response = client.post(
+            "/v1/traces", content=b"", headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid JSON: Empty request body"
+        mock_mongodb_client.write_telemetry_data.assert_not_called()
+
     @pytest.mark.unit
     def test_non_json_content_type_rejected(self, client):
         """Test that non-JSON content types are rejected."""
@@ -283,9 +296,9 @@ class TestTelemetryEndpoints:
         )
 
         assert response.status_code == 200
-        data = response.json()
-        # OTLP-compliant response should be empty dict on success
-        assert data == {}
+        # OTLP-compliant response is an empty protobuf message on success
+        assert response.headers["content-type"] == "application/x-protobuf"
+        assert response.content == b""
 
     @pytest.mark.unit
     def test_submit_protobuf_metrics_success(
@@ -299,9 +312,9 @@ class TestTelemetryEndpoints:
         )
 
         assert response.status_code == 200
-        data = response.json()
-        # OTLP-compliant response should be empty dict on success
-        assert data == {}
+        # OTLP-compliant response is an empty protobuf message on success
+        assert response.headers["content-type"] == "application/x-protobuf"
+        assert response.content == b""
 
     @pytest.mark.unit
     def test_submit_protobuf_logs_success(self, client, protobuf_logs_data, mock_mongodb_client):
@@ -313,9 +326,9 @@ class TestTelemetryEndpoints:
         )
 
         assert response.status_code == 200
-        data = response.json()
-        # OTLP-compliant response should be empty dict on success
-        assert data == {}
+        # OTLP-compliant response is an empty protobuf message on success
+        assert response.headers["content-type"] == "application/x-protobuf"
+        assert response.content == b""
 
     @pytest.mark.unit
     def test_protobuf_malformed_data_error(self, client, malformed_protobuf_data):
@@ -332,6 +345,19 @@ class TestTelemetryEndpoints:
         assert "message" in data
         assert "Invalid protobuf" in data["message"] or "Error parsing protobuf" in data["message"]
 
+    @pytest.mark.unit
+    def test_protobuf_malformed_data_not_logged_as_error(self, client, malformed_protobuf_data):
+        """Test that a malformed protobuf body is not logged as a server error."""
+        with patch("app.main.logger") as mock_logger:
+            response = client.post(
+                "/v1/traces",
+                content=malformed_protobuf_data["binary_data"],
+                headers={"Content-Type": "application/x-protobuf"},
+            )
+
+        assert response.status_code == 400
+        mock_logger.error.assert_not_called()
+
     @pytest.mark.unit
     def test_protobuf_empty_data_error(self, client):
         """Test empty protobuf data returns 400."""
@@ -423,8 +449,40 @@ class TestTelemetryEndpoints:
         )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data == {}
+        assert response.content == b""
+
+    @pytest.mark.unit
+    def test_protobuf_decoded_in_thread_above_threshold(
+        self, client, protobuf_traces_data, mock_mongodb_client
+    ):
+        """Test that bodies above the offload threshold are decoded off the event loop."""
+        with (
+            patch("app.main._OFFLOAD_THRESHOLD_BYTES", 0),
+            patch("app.main.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread,
+        ):
+            response = client.post(
+                "/v1/traces",
+                content=protobuf_traces_data["binary_data"],
+                headers={"Content-Type": "application/x-protobuf"},
+            )
+
+        assert response.status_code == 200
+        mock_to_thread.assert_called_once()
+        mock_mongodb_client.write_telemetry_data.assert_called_once()
+
+    @pytest.mark.unit
+    def test_request_body_too_large(self, client, protobuf_traces_data, mock_mongodb_client):
+        """Test that bodies over the size limit are rejected with 413."""
+        with patch("app.main._MAX_REQUEST_BODY_BYTES", 16):
+            response = client.post(
+                "/v1/traces",
+                content=protobuf_traces_data["binary_data"],
+                headers={"Content-Type": "application/x-protobuf"},
+            )
+
+        assert response.status_code == 413
+        assert "too large" in response.json()["detail"]
+        mock_mongodb_client.write_telemetry_data.assert_not_called()
 
     @pytest.mark.unit
     def test_mixed_requests_same_endpoint(
@@ -1,9 +1,19 @@
 """Tests for Pydantic models edge cases and validation."""
 
 import pytest
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
 from pydantic import ValidationError
 
-from app.models import OTELLogsData, OTELMetric, OTELMetricsData, OTELTracesData
+from app.models import (
+    OTELLogsData,
+    OTELMetric,
+    OTELMetricsData,
+    OTELResource,
+    OTELSpan,
+    OTELTracesData,
+)
 
 
 class TestModelValidationEdgeCases:
@@ -93,3 +103,67 @@ class TestModelValidationEdgeCases:
         logs_data = OTELLogsData(**json_logs_data["data"])
         assert logs_data.resource_logs
         assert len(logs_data.resource_logs) > 0
+
+    @pytest.mark.unit
+    def test_attributes_validated_as_dicts(self):
+        """Test that attributes stay plain dicts but still require a key and value."""
+        resource = OTELResource(attributes=[{"key": "k", "value": {"stringValue": "v"}}])
+        assert resource.attributes == [{"key": "k", "value": {"stringValue": "v"}}]
+        assert type(resource.attributes[0]) is dict
+
+        with pytest.raises(ValidationError):
+            OTELResource(attributes=[{"key": "k"}])
+
+    @pytest.mark.unit
+    def test_field_names_accepted_alongside_aliases(self):
+        """Test that models accept snake_case field names as well as camelCase aliases."""
+        span = OTELSpan(
+            trace_id="abc",
+            span_id="def",
+            name="span",
+            kind=1,
+            start_time_unix_nano="1",
+            end_time_unix_nano="2",
+        )
+        assert span.model_dump(by_alias=True)["traceId"] == "abc"
+
+
+class TestFromProtobuf:
+    """Test direct model construction from parsed protobuf requests."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "model_class,request_class,data_type",
+        [
+            (OTELTracesData, ExportTraceServiceRequest, "traces"),
+            (OTELMetricsData, ExportMetricsServiceRequest, "metrics"),
+            (OTELLogsData, ExportLogsServiceRequest, "logs"),
+        ],
+    )
+    def test_from_protobuf_matches_json(self, request, model_class, request_class, data_type):
+        """Test that protobuf and JSON encodings of the same data dump identically."""
+        json_data = request.getfixturevalue(f"json_{data_type}_data")["data"]
+        binary_data = request.getfixturevalue(f"protobuf_{data_type}_data")["binary_data"]
+
+        from_protobuf = model_class.from_protobuf(request_class.FromString(binary_data))
+
+        assert from_protobuf.model_dump(by_alias=True) == model_class(**json_data).model_dump(
+            by_alias=True
+        )
+
+    @pytest.mark.unit
+    def test_from_protobuf_renders_ids_as_hex(self, protobuf_traces_data):
+        """Test that bytes trace and span IDs are rendered as hex strings."""
+        pb = ExportTraceServiceRequest.FromString(protobuf_traces_data["binary_data"])
+
+        traces_data = OTELTracesData.from_protobuf(pb)
+
+        span = traces_data.resource_spans[0].scope_spans[0].spans[0]
+        assert span.trace_id == "abcdef1234567890abcdef1234567890"
+        assert span.span_id == "1234567890abcdef"
+
+    @pytest.mark.unit
+    def test_from_protobuf_validates(self):
+        """Test that protobuf conversion runs validators."""
+        with pytest.raises(ValidationError):
+            OTELTracesData.from_protobuf(ExportTraceServiceRequest())
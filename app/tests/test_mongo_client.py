@@ -1,8 +1,11 @@
 """Test MongoDB client functionality with comprehensive edge case coverage."""
 
+import asyncio
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from bson.raw_bson import RawBSONDocument
 from pymongo.errors import ConnectionFailure, OperationFailure
 
 from app.mongo_client import MongoDBClient, get_mongodb_client
@@ -77,8 +80,6 @@ def setup_mongo_client_mocks():
     """Fixture to setup common mocks for MongoDBClient instance."""
 
     def _setup_mocks(mongo_client, primary_client=None, secondary_client=None):
-        mongo_client._validate_connection = AsyncMock(return_value=True)
-        mongo_client._ensure_database_setup_on_write = AsyncMock()
 
         mongo_client.primary_client = primary_client
         mongo_client.secondary_client = secondary_client
@@ -104,21 +105,37 @@ class TestMongoDBClient:
         ):
             return MongoDBClient()
 
+    def test_write_concern_defaults_to_primary_ack(self, mongo_client):
+        """Test that inserts default to a primary acknowledgement without journaling."""
+        assert mongo_client.write_concern.document == {"w": 1, "j": False}
+
+    def test_write_concern_from_environment(self):
+        """Test that the write concern can be configured from the environment."""
+        with patch.dict(
+            "os.environ",
+            {"MONGODB_WRITE_CONCERN_W": "majority", "MONGODB_WRITE_CONCERN_J": "1"},
+        ):
+            mongo_client = MongoDBClient()
+
+        assert mongo_client.write_concern.document == {"w": "majority", "j": True}
+
     @pytest.mark.unit
-    @patch("app.mongo_client.AsyncIOMotorClient")
-    async def test_connect_primary_success(self, mock_motor_client, mongo_client):
+    @patch("app.mongo_client.AsyncMongoClient")
+    async def test_connect_primary_success(self, mock_mongo_client_cls, mongo_client):
         """Test successful primary connection."""
         mock_client = AsyncMock()
         mock_client.admin.command = AsyncMock(return_value={"ok": 1})
-        mock_motor_client.return_value = mock_client
+        mock_mongo_client_cls.return_value = mock_client
 
         await mongo_client.connect()
 
         assert mongo_client.primary_client == mock_client
         mock_client.admin.command.assert_called_with("ping")
+        assert mock_mongo_client_cls.call_args.kwargs["minPoolSize"] == 5
+        assert mock_mongo_client_cls.call_args.kwargs["compressors"] == "zstd,zlib"
 
-    @patch("app.mongo_client.AsyncIOMotorClient")
-    async def test_connect_primary_failure(self, mock_motor_client):
+    @patch("app.mongo_client.AsyncMongoClient")
+    async def test_connect_primary_failure(self, mock_mongo_client_cls):
         """Test primary connection failure with graceful degradation."""
         # Setup environment for both primary and secondary
         with patch.dict(
@@ -141,12 +158,12 @@ class TestMongoDBClient:
         mock_secondary_client.admin.command = AsyncMock(return_value={"ok": 1})
 
         # Return different clients for different URIs
-        def side_effect(uri):
+        def side_effect(uri, **kwargs):
             if "localhost" in uri:
                 return mock_primary_client
             return mock_secondary_client
 
-        mock_motor_client.side_effect = side_effect
+        mock_mongo_client_cls.side_effect = side_effect
 
         await mongo_client.connect()
 
@@ -154,8 +171,8 @@ class TestMongoDBClient:
         assert mongo_client.primary_client is None
         assert mongo_client.secondary_client == mock_secondary_client
 
-    @patch("app.mongo_client.AsyncIOMotorClient")
-    async def test_connect_secondary_success(self, mock_motor_client):
+    @patch("app.mongo_client.AsyncMongoClient")
+    async def test_connect_secondary_success(self, mock_mongo_client_cls):
         """Test secondary connection success."""
         with patch.dict(
             "os.environ",
@@ -168,15 +185,15 @@ class TestMongoDBClient:
 
         mock_client = AsyncMock()
         mock_client.admin.command = AsyncMock(return_value={"ok": 1})
-        mock_motor_client.return_value = mock_client
+        mock_mongo_client_cls.return_value = mock_client
 
         await mongo_client.connect()
 
         assert mongo_client.secondary_client == mock_client
         assert mongo_client.primary_client is None
 
-    @patch("app.mongo_client.AsyncIOMotorClient")
-    async def test_connect_secondary_failure(self, mock_motor_client):
+    @patch("app.mongo_client.AsyncMongoClient")
+    async def test_connect_secondary_failure(self, mock_mongo_client_cls):
         """Test secondary connection failure."""
         with patch.dict(
             "os.environ",
@@ -197,12 +214,12 @@ class TestMongoDBClient:
             side_effect=OperationFailure("Secondary connection failed")
         )
 
-        def side_effect(uri):
+        def side_effect(uri, **kwargs):
             if "primary" in uri:
                 return mock_primary_client
             return mock_secondary_client
 
-        mock_motor_client.side_effect = side_effect
+        mock_mongo_client_cls.side_effect = side_effect
 
         await mongo_client.connect()
 
@@ -219,8 +236,8 @@ class TestMongoDBClient:
         with pytest.raises(ConnectionError, match="No MongoDB databases available"):
             await mongo_client_no_uri.connect()
 
-    @patch("app.mongo_client.AsyncIOMotorClient")
-    async def test_connect_both_fail_raises_error(self, mock_motor_client):
+    @patch("app.mongo_client.AsyncMongoClient")
+    async def test_connect_both_fail_raises_error(self, mock_mongo_client_cls):
         """Test that ConnectionError is raised when both databases fail to connect."""
         with patch.dict(
             "os.environ",
@@ -235,35 +252,33 @@ class TestMongoDBClient:
         # Mock both clients to fail
         mock_client = AsyncMock()
         mock_client.admin.command = AsyncMock(side_effect=ConnectionFailure("Connection failed"))
-        mock_motor_client.return_value = mock_client
+        mock_mongo_client_cls.return_value = mock_client
 
         with pytest.raises(ConnectionError, match="No MongoDB databases available"):
             await mongo_client.connect()
 
     async def test_disconnect_both_clients(self, mongo_client):
         """Test disconnecting from both databases."""
-        # Mock both clients with MagicMock for close() to avoid warnings
-        mock_primary = MagicMock()
-        mock_secondary = MagicMock()
+        mock_primary = AsyncMock()
+        mock_secondary = AsyncMock()
 
         mongo_client.primary_client = mock_primary
         mongo_client.secondary_client = mock_secondary
 
         await mongo_client.disconnect()
 
-        mock_primary.close.assert_called_once()
-        mock_secondary.close.assert_called_once()
+        mock_primary.close.assert_awaited_once()
+        mock_secondary.close.assert_awaited_once()
 
     async def test_disconnect_partial_clients(self, mongo_client):
         """Test disconnecting when only some clients are available."""
-        # Mock only primary client with MagicMock for close() to avoid warnings
-        mock_primary = MagicMock()
+        mock_primary = AsyncMock()
         mongo_client.primary_client = mock_primary
         mongo_client.secondary_client = None
 
         await mongo_client.disconnect()
 
-        mock_primary.close.assert_called_once()
+        mock_primary.close.assert_awaited_once()
 
     async def test_write_telemetry_data_success(
         self, mongo_client, mock_successful_client, setup_mongo_client_mocks
@@ -280,14 +295,35 @@ class TestMongoDBClient:
         assert result["success"] is True
         assert result["primary_success"] is True
         assert result["secondary_success"] is None
-        assert result["document_id"] == "test_id_123"
 
         # Verify insert was called with correct data
         mock_collection.insert_one.assert_called_once()
         call_args = mock_collection.insert_one.call_args[0][0]
+        assert isinstance(call_args, RawBSONDocument)
+        assert result["document_id"] == str(call_args["_id"])
+
+        # Writes go straight to the insert without a ping round trip first
+        mock_primary_client.admin.command.assert_not_called()
         assert call_args["test"] == "data"
         assert call_args["data_type"] == "traces"
         assert call_args["request_id"] == "test-123"
+        assert isinstance(call_args["created_at"], datetime)
+
+    async def test_write_telemetry_data_reuses_collection(
+        self, mongo_client, mock_successful_client, setup_mongo_client_mocks
+    ):
+        """Test that the collection handle is resolved once and reused across writes."""
+        mock_primary_client, mock_collection = mock_successful_client
+        setup_mongo_client_mocks(mongo_client, primary_client=mock_primary_client)
+
+        for _ in range(2):
+            await mongo_client.write_telemetry_data(data={"test": "data"}, data_type="traces")
+
+        mock_primary_client.get_database.assert_called_once()
+        assert mock_collection.insert_one.call_count == 2
+
+        await mongo_client.disconnect()
+        assert mongo_client._collection_cache == {}
 
     async def test_write_telemetry_data_both_databases(
         self, mongo_client, mock_client_factory, setup_mongo_client_mocks
@@ -316,7 +352,7 @@ class TestMongoDBClient:
     ):
         """Test telemetry write when primary fails but secondary succeeds."""
         mock_primary_client, _ = mock_client_factory(should_fail=True)
-        mock_secondary_client, _ = mock_client_factory("secondary_id_456")
+        mock_secondary_client, mock_secondary_collection = mock_client_factory("secondary_id_456")
         setup_mongo_client_mocks(
             mongo_client, primary_client=mock_primary_client, secondary_client=mock_secondary_client
         )
@@ -328,10 +364,47 @@ class TestMongoDBClient:
         assert result["success"] is True  # Overall success because secondary succeeded
         assert result["primary_success"] is False
         assert result["secondary_success"] is True
-        assert result["document_id"] == "secondary_id_456"  # Uses secondary ID
+        secondary_document = mock_secondary_collection.insert_one.call_args[0][0]
+        assert result["document_id"] == str(secondary_document["_id"])
         assert len(result["errors"]) == 1
         assert "Write failed" in result["errors"][0]
 
+    async def test_write_telemetry_data_writes_concurrently(
+        self, mongo_client, mock_client_factory, setup_mongo_client_mocks
+    ):
+        """Test that primary and secondary writes are in flight at the same time."""
+        mock_primary_client, mock_primary_collection = mock_client_factory("primary_id_123")
+        mock_secondary_client, mock_secondary_collection = mock_client_factory("secondary_id_456")
+        setup_mongo_client_mocks(
+            mongo_client, primary_client=mock_primary_client, secondary_client=mock_secondary_client
+        )
+        primary_result = mock_primary_collection.insert_one.return_value
+        secondary_result = mock_secondary_collection.insert_one.return_value
+        secondary_started = asyncio.Event()
+
+        async def primary_insert(document):
+            # Only completes if the secondary write starts while this one is pending
+            await asyncio.wait_for(secondary_started.wait(), timeout=1)
+            return primary_result
+
+        async def secondary_insert(document):
+            secondary_started.set()
+            return secondary_result
+
+        mock_primary_collection.insert_one.side_effect = primary_insert
+        mock_secondary_collection.insert_one.side_effect = secondary_insert
+
+        result = await mongo_client.write_telemetry_data(
+            data={"test": "data"}, data_type="traces", request_id="test-123"
+        )
+
+        assert result["primary_success"] is True
+        assert result["secondary_success"] is True
+        # Both databases are sent the same pre-encoded document
+        primary_document = mock_primary_collection.insert_one.call_args[0][0]
+        assert mock_secondary_collection.insert_one.call_args[0][0] is primary_document
+        assert result["document_id"] == str(primary_document["_id"])
+
     async def test_write_telemetry_data_both_fail(
         self, mongo_client, mock_client_factory, setup_mongo_client_mocks
     ):
@@ -425,6 +498,22 @@ class TestMongoDBClient:
         assert health[db_type]["connected"] is False
         assert error_message in health[db_type]["error"]
 
+    async def test_health_check_ping_timeout(self, mongo_client):
+        """Test that a database that does not answer the ping is reported as unhealthy."""
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        mock_client = AsyncMock()
+        mock_client.admin.command = AsyncMock(side_effect=hang)
+        mongo_client.primary_client = mock_client
+
+        with patch("app.mongo_client._HEALTH_CHECK_TIMEOUT_SECONDS", 0.01):
+            health = await mongo_client.health_check()
+
+        assert health["primary"]["connected"] is False
+        assert "timed out" in health["primary"]["error"]
+
     async def test_health_check_both_databases_configured(self, mongo_client):
         """Test health check with both databases configured."""
         with patch.dict(
@@ -505,54 +594,46 @@ class TestMongoDBClient:
             mock_collection.create_index = AsyncMock()
             await mongo_client._ensure_indexes(mock_collection, collection_name, db_type)
             mock_collection.create_index.assert_called_once_with(
-                "created_at", background=True, name=f"{collection_name}_created_at_idx"
+                "created_at", name=f"{collection_name}_created_at_idx"
             )
 
     async def test_database_setup_integration_with_connect(self, mongo_client):
         """Test that database setup is called during connection."""
         with patch.object(mongo_client, "_ensure_database_setup") as mock_setup:
-            with patch("app.mongo_client.AsyncIOMotorClient") as mock_motor_client:
+            with patch("app.mongo_client.AsyncMongoClient") as mock_mongo_client_cls:
                 mock_client = AsyncMock()
                 mock_client.admin.command = AsyncMock(return_value={"ok": 1})
-                mock_motor_client.return_value = mock_client
+                mock_mongo_client_cls.return_value = mock_client
 
                 await mongo_client.connect()
+                await asyncio.gather(*mongo_client._setup_tasks)
 
                 # Verify setup was called for primary database
                 mock_setup.assert_called_once_with(mock_client, "primary")
 
-    async def test_database_setup_on_write_when_not_done_during_connect(self, mongo_client):
-        """Test that database setup happens on first write if not done during connection."""
-        # Simulate a client that connected but didn't complete setup
-        mock_client = AsyncMock()
-        mock_database = MagicMock()
-        mock_collection = MagicMock()
-        mock_insert_result = MagicMock()
-        mock_insert_result.inserted_id = "test_id_123"
+    async def test_connect_does_not_wait_for_database_setup(self, mongo_client):
+        """Test that connect returns while database setup continues in the background."""
+        setup_released = asyncio.Event()
 
-        # Setup mock hierarchy using get_database approach
-        mock_database.__getitem__.return_value = mock_collection
-        mock_collection.create_index = AsyncMock()
-        mock_collection.insert_one = AsyncMock(return_value=mock_insert_result)
-        mock_client.get_database = MagicMock(return_value=mock_database)
+        async def slow_setup(client, db_type):
+            await setup_released.wait()
 
-        # Mock _validate_connection to return True
-        mongo_client._validate_connection = AsyncMock(return_value=True)
+        with (
+            patch.object(mongo_client, "_ensure_database_setup", side_effect=slow_setup),
+            patch("app.mongo_client.AsyncMongoClient") as mock_mongo_client_cls,
+        ):
+            mock_client = AsyncMock()
+            mock_client.admin.command = AsyncMock(return_value={"ok": 1})
+            mock_mongo_client_cls.return_value = mock_client
 
-        # Set client but mark setup as incomplete
-        mongo_client.secondary_client = mock_client
-        mongo_client.secondary_setup_complete = False
+            await mongo_client.connect()
 
-        # Write data
-        result = await mongo_client.write_telemetry_data(
-            data={"test": "data"}, data_type="traces", request_id="test-123"
-        )
+            assert mongo_client.primary_client == mock_client
+            assert len(mongo_client._setup_tasks) == 1
 
-        # Verify setup was called during write
-        assert mongo_client.secondary_setup_complete is True
-        # Verify write succeeded
-        assert result["success"] is True
-        assert result["secondary_success"] is True
+            # Disconnecting cancels setup that is still in progress
+            await mongo_client.disconnect()
+            assert not mongo_client._setup_tasks
 
 
 @pytest.mark.unit
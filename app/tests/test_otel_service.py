@@ -79,25 +79,47 @@ class TestOTELService:
         assert "data" in call_args[1]
         assert call_args[1]["request_id"] is None
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_process_logs_omits_unset_fields(self, otel_service, mock_mongodb_client):
+        """Test that unset optional fields are left out of the stored document."""
+        logs_data = OTELLogsData(
+            resourceLogs=[
+                {
+                    "resource": {},
+                    "scopeLogs": [{"scope": {"name": "scope"}, "logRecords": [{"body": None}]}],
+                }
+            ]
+        )
+
+        await otel_service.process_logs(logs_data)
+
+        data = mock_mongodb_client.write_telemetry_data.call_args[1]["data"]
+        scope_logs = data["resourceLogs"][0]["scopeLogs"][0]
+        assert scope_logs["scope"] == {"name": "scope"}
+        assert scope_logs["logRecords"] == [{"attributes": []}]
+
     @pytest.mark.unit
     def test_count_spans(self, otel_service, json_traces_data):
         """Test span counting using unified traces fixture."""
-        count_keys = ("resourceSpans", "scopeSpans", "spans")
-        count = otel_service._count_records(json_traces_data["data"], count_keys)
+        count_attrs = ("resource_spans", "scope_spans", "spans")
+        count = otel_service._count_records(OTELTracesData(**json_traces_data["data"]), count_attrs)
         assert count == json_traces_data["expected_count"]
 
     @pytest.mark.unit
     def test_count_metrics(self, otel_service, json_metrics_data):
         """Test metrics counting using unified metrics fixture."""
-        count_keys = ("resourceMetrics", "scopeMetrics", "metrics")
-        count = otel_service._count_records(json_metrics_data["data"], count_keys)
+        count_attrs = ("resource_metrics", "scope_metrics", "metrics")
+        count = otel_service._count_records(
+            OTELMetricsData(**json_metrics_data["data"]), count_attrs
+        )
         assert count == json_metrics_data["expected_count"]
 
     @pytest.mark.unit
     def test_count_log_records(self, otel_service, json_logs_data):
         """Test log records counting using unified logs fixture."""
-        count_keys = ("resourceLogs", "scopeLogs", "logRecords")
-        count = otel_service._count_records(json_logs_data["data"], count_keys)
+        count_attrs = ("resource_logs", "scope_logs", "log_records")
+        count = otel_service._count_records(OTELLogsData(**json_logs_data["data"]), count_attrs)
         assert count == json_logs_data["expected_count"]
 
     @pytest.mark.unit
@@ -0,0 +1,224 @@
+"""Tests for OTLP protobuf to dict conversion."""
+
+import pytest
+from google.protobuf.json_format import ParseDict
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+from app.otlp_to_dict import logs_request_to_dict, metric_request_to_dict, trace_request_to_dict
+
+
+# Base64 encodings of the hex IDs used throughout the fixtures
+TRACE_ID_B64 = "q83vEjRWeJCrze8SNFZ4kA=="
+TRACE_ID_HEX = "abcdef1234567890abcdef1234567890"
+SPAN_ID_B64 = "EjRWeJCrze8="
+SPAN_ID_HEX = "1234567890abcdef"
+
+
+class TestTraceRequestToDict:
+    """Test trace request conversion."""
+
+    @pytest.mark.unit
+    def test_span_fields(self):
+        """Test that span fields use camelCase keys, hex IDs and string int64s."""
+        pb = ParseDict(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": {
+                            "attributes": [{"key": "service.name", "value": {"stringValue": "svc"}}]
+                        },
+                        "scopeSpans": [
+                            {
+                                "scope": {"name": "scope", "version": "1.0"},
+                                "spans": [
+                                    {
+                                        "traceId": TRACE_ID_B64,
+                                        "spanId": SPAN_ID_B64,
+                                        "name": "span",
+                                        "kind": 2,
+                                        "startTimeUnixNano": "100",
+                                        "endTimeUnixNano": "200",
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ]
+            },
+            ExportTraceServiceRequest(),
+        )
+
+        assert trace_request_to_dict(pb) == {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [{"key": "service.name", "value": {"stringValue": "svc"}}]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "scope", "version": "1.0"},
+                            "spans": [
+                                {
+                                    "attributes": [],
+                                    "traceId": TRACE_ID_HEX,
+                                    "spanId": SPAN_ID_HEX,
+                                    "name": "span",
+                                    "kind": 2,
+                                    "startTimeUnixNano": "100",
+                                    "endTimeUnixNano": "200",
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    @pytest.mark.unit
+    def test_default_fields_omitted(self):
+        """Test that unset messages and default scalars are omitted like MessageToDict."""
+        pb = ParseDict(
+            {"resourceSpans": [{"scopeSpans": [{"spans": [{"name": "span"}]}]}]},
+            ExportTraceServiceRequest(),
+        )
+
+        resource_spans = trace_request_to_dict(pb)["resourceSpans"][0]
+        assert "resource" not in resource_spans
+        scope_spans = resource_spans["scopeSpans"][0]
+        assert "scope" not in scope_spans
+        assert scope_spans["spans"] == [{"attributes": [], "name": "span"}]
+
+    @pytest.mark.unit
+    def test_attribute_value_kinds(self):
+        """Test conversion of every AnyValue kind."""
+        attributes = [
+            {"key": "str", "value": {"stringValue": "text"}},
+            {"key": "int", "value": {"intValue": "-5"}},
+            {"key": "double", "value": {"doubleValue": 0.0}},
+            {"key": "bool", "value": {"boolValue": False}},
+            {"key": "bytes", "value": {"bytesValue": "AAE="}},
+            {"key": "array", "value": {"arrayValue": {"values": [{"intValue": "1"}]}}},
+            {"key": "empty_array", "value": {"arrayValue": {}}},
+            {
+                "key": "kvlist",
+                "value": {
+                    "kvlistValue": {"values": [{"key": "nested", "value": {"boolValue": True}}]}
+                },
+            },
+            {"key": "unset", "value": {}},
+        ]
+        pb = ParseDict(
+            {"resourceSpans": [{"resource": {"attributes": attributes}}]},
+            ExportTraceServiceRequest(),
+        )
+
+        assert trace_request_to_dict(pb)["resourceSpans"][0]["resource"]["attributes"] == (
+            attributes
+        )
+
+
+class TestMetricRequestToDict:
+    """Test metric request conversion."""
+
+    @pytest.mark.unit
+    def test_gauge_and_sum(self):
+        """Test that gauge and sum metrics keep their data point values."""
+        pb = ParseDict(
+            {
+                "resourceMetrics": [
+                    {
+                        "scopeMetrics": [
+                            {
+                                "scope": {"name": "scope"},
+                                "metrics": [
+                                    {
+                                        "name": "gauge",
+                                        "unit": "1",
+                                        "gauge": {
+                                            "dataPoints": [{"timeUnixNano": "5", "asDouble": 0.0}]
+                                        },
+                                    },
+                                    {
+                                        "name": "sum",
+                                        "description": "total",
+                                        "sum": {
+                                            "dataPoints": [{"timeUnixNano": "5", "asInt": "7"}],
+                                            "aggregationTemporality": 2,
+                                            "isMonotonic": True,
+                                        },
+                                    },
+                                ],
+                            }
+                        ]
+                    }
+                ]
+            },
+            ExportMetricsServiceRequest(),
+        )
+
+        metrics = metric_request_to_dict(pb)["resourceMetrics"][0]["scopeMetrics"][0]["metrics"]
+        assert metrics == [
+            {
+                "name": "gauge",
+                "unit": "1",
+                "gauge": {"dataPoints": [{"attributes": [], "timeUnixNano": "5", "asDouble": 0.0}]},
+            },
+            {
+                "name": "sum",
+                "description": "total",
+                "sum": {
+                    "dataPoints": [{"attributes": [], "timeUnixNano": "5", "asInt": "7"}],
+                    "aggregationTemporality": 2,
+                    "isMonotonic": True,
+                },
+            },
+        ]
+
+
+class TestLogsRequestToDict:
+    """Test logs request conversion."""
+
+    @pytest.mark.unit
+    def test_log_record_fields(self):
+        """Test that set log fields are converted and unset ones omitted."""
+        pb = ParseDict(
+            {
+                "resourceLogs": [
+                    {
+                        "scopeLogs": [
+                            {
+                                "scope": {"name": "scope"},
+                                "logRecords": [
+                                    {
+                                        "timeUnixNano": "9",
+                                        "severityNumber": 9,
+                                        "severityText": "INFO",
+                                        "body": {"stringValue": "hello"},
+                                        "traceId": TRACE_ID_B64,
+                                        "spanId": SPAN_ID_B64,
+                                    },
+                                    {},
+                                ],
+                            }
+                        ]
+                    }
+                ]
+            },
+            ExportLogsServiceRequest(),
+        )
+
+        records = logs_request_to_dict(pb)["resourceLogs"][0]["scopeLogs"][0]["logRecords"]
+        assert records == [
+            {
+                "attributes": [],
+                "timeUnixNano": "9",
+                "severityNumber": 9,
+                "severityText": "INFO",
+                "body": {"stringValue": "hello"},
+                "traceId": TRACE_ID_HEX,
+                "spanId": SPAN_ID_HEX,
+            },
+            {"attributes": []},
+        ]